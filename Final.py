@@ -14,6 +14,8 @@ It features:
 Dependencies:
 - pyautogui: For controlling the mouse and getting screen dimensions.
 - tkinter: For the GUI control panel.
+- python-xlib (optional): For event-driven pointer motion and batched XTest
+  pointer injection on Linux/X11.
 
 Platform:
 - This script is designed for Windows due to the use of `ctypes` to set
@@ -26,12 +28,24 @@ import random
 import time
 import sys
 import ctypes
+import weakref
+from collections import deque
 import pyautogui
 
+from frame_governor import DEFAULT_TARGET_FPS, FrameGovernor
+from pointer_events import PointerMotionListener
+from pointer_inject import PointerInjector
+from sprites import SHAPES, SpriteCache
+
 # --- Constants ---
 # Windows API constant for setting mouse speed
 SPI_SETMOUSESPEED = 113
 DEFAULT_MOUSE_SPEED = 10
+FAKE_CURSOR_SIZE = 10
+# Polling interval for the flicker effect; speed thresholds are in pixels per interval
+FLICKER_INTERVAL_MS = 50
+# Time per point of a jitter burst when moves are injected through XTest
+JITTER_STEP = 0.005
 
 
 class FakeCursor(tk.Toplevel):
@@ -42,47 +56,60 @@ class FakeCursor(tk.Toplevel):
     near the actual mouse cursor to create a swarm effect.
     """
 
-    def __init__(self, master, shape="dot"):
+    def __init__(self, master, sprites, shape="dot"):
         """
         Initializes the fake cursor window.
 
         Args:
             master: The parent tk.Tk() instance.
+            sprites (SpriteCache): The sprite cache shared by all fake cursors.
             shape (str): The shape of the cursor ('dot', 'square', 'cross').
         """
         super().__init__(master)
         self.master = master
+        self.sprites = sprites
         self.screen_width, self.screen_height = pyautogui.size()
 
         # Make the window borderless and always on top
         self.overrideredirect(True)
         self.attributes("-topmost", True)
 
-        # Use a transparent background
+        # Use a transparent background (the attribute only exists on Windows)
         self.config(bg="black")
-        self.attributes("-transparentcolor", "black")
+        try:
+            self.attributes("-transparentcolor", "black")
+        except tk.TclError:
+            pass
 
-        # Canvas to draw the shape on
-        self.canvas = tk.Canvas(self, width=10, height=10, bg="black", highlightthickness=0)
+        # Canvas holding a single image item that shows the cached sprite
+        self.canvas = tk.Canvas(
+            self, width=FAKE_CURSOR_SIZE, height=FAKE_CURSOR_SIZE, bg="black", highlightthickness=0
+        )
         self.canvas.pack()
+        self.sprite_item = self.canvas.create_image(0, 0, anchor="nw")
+
+        # id of the pending `after` callback driving this cursor's movement
+        self.move_after_id = None
 
         self.set_shape(shape)
 
     def set_shape(self, shape):
         """
-        Clears the canvas and draws the specified shape.
+        Points the canvas image at the cached sprite for the specified shape.
 
         Args:
-            shape (str): The new shape to draw ('dot', 'square', 'cross').
+            shape (str): The new shape to show ('dot', 'square', 'cross').
         """
-        self.canvas.delete("all")
-        if shape == "square":
-            self.canvas.create_rectangle(0, 0, 10, 10, fill="white", outline="white")
-        elif shape == "cross":
-            self.canvas.create_line(0, 5, 10, 5, fill="white", width=2)
-            self.canvas.create_line(5, 0, 5, 10, fill="white", width=2)
-        else:  # Default to dot
-            self.canvas.create_oval(-2, -2, 8, 8, fill="white", outline="white")
+        self.set_sprite(self.sprites.get(shape, FAKE_CURSOR_SIZE))
+
+    def set_sprite(self, sprite):
+        """
+        Swaps the displayed image for an already rendered sprite.
+
+        Args:
+            sprite (tk.PhotoImage): A sprite from the shared SpriteCache.
+        """
+        self.canvas.itemconfig(self.sprite_item, image=sprite)
 
     def move_to(self, x, y):
         """
@@ -96,6 +123,31 @@ class FakeCursor(tk.Toplevel):
         y = max(0, min(self.screen_height - 10, y))
         self.geometry(f"+{x}+{y}")
 
+    def schedule_move(self, delay, callback):
+        """
+        Schedules the cursor's next move, replacing any pending one.
+
+        The callback receives a weak reference to this cursor, so a queued
+        timer never keeps a removed cursor alive.
+
+        Args:
+            delay (int): Milliseconds until the move.
+            callback (callable): Called with a weakref.ref to this cursor.
+        """
+        self.cancel_move()
+        self.move_after_id = self.master.after(delay, callback, weakref.ref(self))
+
+    def cancel_move(self):
+        """Cancels the pending move, if any."""
+        if self.move_after_id is not None:
+            self.master.after_cancel(self.move_after_id)
+            self.move_after_id = None
+
+    def destroy(self):
+        """Cancels the pending move before destroying the window."""
+        self.cancel_move()
+        super().destroy()
+
 
 class ControlPanel(tk.Toplevel):
     """
@@ -116,7 +168,7 @@ class ControlPanel(tk.Toplevel):
         super().__init__(master)
         self.app_state = app_state
         self.title("Control Panel")
-        self.geometry("300x340") # Increased height for new slider
+        self.geometry("300x440") # Increased height for new slider
         self.attributes("-topmost", True)
 
         # When the window is closed, call the on_close method instead of destroying it
@@ -174,13 +226,24 @@ class ControlPanel(tk.Toplevel):
 
         # Fake Cursor Shape Radio Buttons
         tk.Label(self, text="Fake Cursor Shape:").pack(anchor="w", padx=10)
-        shapes = ["dot", "square", "cross"]
-        for shape in shapes:
+        for shape in SHAPES:
             tk.Radiobutton(
                 self, text=shape.capitalize(), variable=self.app_state['shape_var'], value=shape,
                 command=lambda: self.app_state.update_state('fake_cursor_shape', self.app_state['shape_var'].get())
             ).pack(anchor="w", padx=20)
 
+        # Target FPS Slider
+        tk.Label(self, text="Target FPS:").pack(anchor="w", padx=10)
+        fps_scale = tk.Scale(
+            self, from_=10, to=60, orient="horizontal",
+            command=lambda val: self.app_state.update_state('target_fps', int(val))
+        )
+        fps_scale.set(self.app_state['target_fps'])
+        fps_scale.pack(fill="x", padx=10)
+
+        # Current degradation level reported by the frame governor
+        tk.Label(self, textvariable=self.app_state['quality_var']).pack(anchor="w", padx=10, pady=5)
+
     def on_close(self):
         """Hides the window instead of destroying it."""
         self.withdraw()
@@ -199,10 +262,12 @@ class AppState:
             'speed_threshold': 15,
             'fake_cursor_shape': "dot",
             'num_cursors': 5,
+            'target_fps': DEFAULT_TARGET_FPS,
             'stop_flag': threading.Event(),
             'last_mouse_pos': None,
             'on_shape_change': None, # Callback for when shape changes
             'on_num_cursors_change': None, # Callback for cursor count changes
+            'on_target_fps_change': None, # Callback for target FPS changes
         }
 
         # Tkinter variables for binding to GUI widgets
@@ -210,6 +275,7 @@ class AppState:
         self.chaotic_var = tk.BooleanVar(value=self.state['chaotic_enabled'])
         self.flicker_var = tk.BooleanVar(value=self.state['flicker_enabled'])
         self.shape_var = tk.StringVar(value=self.state['fake_cursor_shape'])
+        self.quality_var = tk.StringVar() # Filled in by the frame governor
 
     def __getitem__(self, key):
         """Allow dictionary-style access to state."""
@@ -225,6 +291,8 @@ class AppState:
                 self.state['on_shape_change'](value)
             elif key == 'num_cursors' and self.state['on_num_cursors_change']:
                 self.state['on_num_cursors_change'](value)
+            elif key == 'target_fps' and self.state['on_target_fps_change']:
+                self.state['on_target_fps_change'](value)
 
     def set_stop_flag(self):
         """Signals all threads to stop."""
@@ -243,55 +311,107 @@ class ChaoticMouseApp:
         self.root.withdraw()
 
         self.app_state = AppState(self.root)
+        # Render every shape once; all fake cursors share these images
+        self.sprites = SpriteCache(self.root)
+        self.sprites.preload(SHAPES, FAKE_CURSOR_SIZE)
         self.control_panel = ControlPanel(self.root, self.app_state)
         
         # --- Create Fake Cursors ---
         self.fake_cursors = []
-        self.update_num_cursors(self.app_state['num_cursors']) # Create initial cursors
+        self.target_num_cursors = self.app_state['num_cursors']
+        self.resize_after_id = None
+        self.resize_swarm() # Create initial cursors
         
         # Set callbacks for state changes
         self.app_state.update_state('on_shape_change', self.update_fake_cursor_shapes)
         self.app_state.update_state('on_num_cursors_change', self.update_num_cursors)
+        self.app_state.update_state('on_target_fps_change', self.update_target_fps)
+
+        # Lowers the fake cursor update rate when frames take too long
+        self.governor = FrameGovernor(
+            self.root, self.app_state['target_fps'], on_change=self.update_quality_level
+        )
+        self.update_quality_level(self.governor.level)
 
 
         # --- Threads ---
         self.mouse_thread = None
+        # Pointer motion events (Linux/X11 only); flicker falls back to polling without them
+        self.motion_listener = PointerMotionListener(self.on_pointer_motion)
+        self.reset_motion_window()
+        self.flicker_until = 0.0
+        # Held while a polling-mode flicker runs on its worker thread
+        self.flicker_lock = threading.Lock()
+        # is_effect_active() as last seen by the Tk thread, for the listener thread
+        self.effects_active = False
+        # Direct XTest pointer injection (Linux/X11 only); pyautogui is used without it
+        self.injector = PointerInjector()
         
         # Ensure cleanup happens when the window is closed
         self.root.protocol("WM_DELETE_WINDOW", self.shutdown)
 
     def update_fake_cursor_shapes(self, new_shape):
         """Callback to change the shape of all fake cursors."""
+        sprite = self.sprites.get(new_shape, FAKE_CURSOR_SIZE)
         for fc in self.fake_cursors:
-            fc.set_shape(new_shape)
+            fc.set_sprite(sprite)
             
+    def update_target_fps(self, target_fps):
+        """Callback to change the frame rate the governor tries to hold."""
+        self.governor.set_target_fps(target_fps)
+
+    def update_quality_level(self, level):
+        """Callback to report the governor's degradation level in the panel."""
+        self.app_state['quality_var'].set(self.governor.describe())
+
     def update_num_cursors(self, new_count):
-        """Adds or removes fake cursors to match the desired count."""
-        # Add new cursors if needed
+        """
+        Callback to change the number of fake cursors.
+
+        Slider movements are coalesced: only the latest count is applied,
+        once the event loop is idle.
+        """
+        self.target_num_cursors = new_count
+        if self.resize_after_id is None:
+            self.resize_after_id = self.root.after_idle(self.resize_swarm)
+
+    def resize_swarm(self):
+        """Adds or removes fake cursors in one batch to match the target count."""
+        self.resize_after_id = None
+        new_count = self.target_num_cursors
+
+        # Remove excess cursors; destroying one also cancels its pending move
+        removed = self.fake_cursors[new_count:]
+        del self.fake_cursors[new_count:]
+        for cursor in removed:
+            cursor.destroy()
+
+        # Add new cursors if needed and start their movement loops
+        shape = self.app_state['fake_cursor_shape']
         while len(self.fake_cursors) < new_count:
-            new_cursor = FakeCursor(self.root, self.app_state['fake_cursor_shape'])
+            new_cursor = FakeCursor(self.root, self.sprites, shape)
             self.fake_cursors.append(new_cursor)
-            # Start its movement loop
-            self.root.after(random.randint(30, 150), lambda c=new_cursor: self.move_fake_cursor(c))
-            
-        # Remove excess cursors
-        while len(self.fake_cursors) > new_count:
-            cursor_to_remove = self.fake_cursors.pop()
-            # The movement loop will naturally stop and destroy it on the next run
-            # because it checks the stop_flag, which we will set temporarily for it.
-            # A simpler way is to just destroy it directly.
-            cursor_to_remove.destroy()
+            new_cursor.schedule_move(random.randint(30, 150), self.move_fake_cursor)
 
     def run(self):
         """Starts all application threads and the main GUI loop."""
         print("Starting Chaotic Mouse. Close the Control Panel window or press Ctrl+C to exit.")
         
+        if self.injector.start():
+            print("Injecting pointer moves through XTest.")
+
         # Start the chaotic mouse movement in a separate thread
         self.mouse_thread = threading.Thread(target=self.chaotic_mouse_movement, daemon=True)
         self.mouse_thread.start()
 
-        # Start the recurring GUI-based tasks
-        self.root.after(50, self.flicker_effect)
+        self.governor.start()
+
+        # React to real pointer motion events when available, otherwise poll
+        if self.motion_listener.start():
+            print("Using X server motion events for the flicker effect.")
+            self.refresh_effects_active()
+        else:
+            self.root.after(FLICKER_INTERVAL_MS, self.flicker_effect)
         # The cursor movement loops are now started in update_num_cursors
 
         try:
@@ -306,7 +426,12 @@ class ChaoticMouseApp:
         self.app_state.set_stop_flag()
         if self.mouse_thread:
             self.mouse_thread.join(timeout=1)
+        self.motion_listener.stop()
+        self.injector.stop()
         set_mouse_speed(DEFAULT_MOUSE_SPEED)
+        self.governor.stop()
+        if self.resize_after_id is not None:
+            self.root.after_cancel(self.resize_after_id)
         self.root.quit()
         self.root.destroy()
         print("Exited.")
@@ -329,12 +454,19 @@ class ChaoticMouseApp:
 
     # --- Effect Functions ---
 
-    def move_fake_cursor(self, cursor):
-        """Moves a single fake cursor and schedules its next move."""
-        # Check if the cursor window still exists before proceeding
-        if not cursor.winfo_exists():
+    def move_fake_cursor(self, cursor_ref):
+        """
+        Moves a single fake cursor and schedules its next move.
+
+        Args:
+            cursor_ref (weakref.ref): Weak reference to the FakeCursor.
+        """
+        cursor = cursor_ref()
+        # The cursor may have been removed since this move was scheduled
+        if cursor is None or not cursor.winfo_exists():
             return
-            
+        cursor.move_after_id = None
+
         if self.app_state['stop_flag'].is_set():
             cursor.destroy()
             return
@@ -345,7 +477,9 @@ class ChaoticMouseApp:
             y = mouse_y + random.randint(-150, 150)
             cursor.move_to(x, y)
 
-        self.root.after(random.randint(30, 150), lambda: self.move_fake_cursor(cursor))
+        # Update less often while the governor has lowered the quality
+        delay = int(random.randint(30, 150) / self.governor.quality)
+        cursor.schedule_move(delay, self.move_fake_cursor)
 
     def flicker_effect(self):
         """
@@ -365,14 +499,94 @@ class ChaoticMouseApp:
                 
                 # If speed is above threshold, apply flicker
                 if dist > self.app_state['speed_threshold']:
-                    offset = self.app_state['flicker_intensity']
-                    pyautogui.moveRel(offset, 0, duration=0.01)
-                    pyautogui.moveRel(-offset, 0, duration=0.01)
+                    self.start_flicker()
 
             self.app_state.update_state('last_mouse_pos', (x, y))
 
         # Schedule the next check
-        self.root.after(50, self.flicker_effect)
+        self.root.after(FLICKER_INTERVAL_MS, self.flicker_effect)
+
+    def on_pointer_motion(self, sample):
+        """
+        Event-driven counterpart of `flicker_effect`, called for every pointer
+        motion event on the motion listener's dispatch thread.
+
+        Args:
+            sample (MotionSample): The position and timestamps of the event.
+        """
+        # Skip the motion caused by our own flicker
+        if sample.received < self.flicker_until:
+            return
+
+        last_pos = self.app_state['last_mouse_pos']
+        self.app_state.update_state('last_mouse_pos', (sample.x, sample.y))
+        if last_pos is None:
+            return
+
+        # Sum the distance moved over the last flicker interval, so the
+        # threshold slider means the same as in polling mode. Server
+        # timestamps only have 1 ms resolution, so a per-event speed would
+        # blow single-pixel steps up into large values.
+        dist = ((sample.x - last_pos[0]) ** 2 + (sample.y - last_pos[1]) ** 2) ** 0.5
+        self.motion_window.append((sample.server_time, dist))
+        self.motion_window_distance += dist
+        while self.motion_window[0][0] <= sample.server_time - FLICKER_INTERVAL_MS:
+            self.motion_window_distance -= self.motion_window.popleft()[1]
+
+        if not self.app_state['flicker_enabled'] or not self.effects_active:
+            return
+        if self.motion_window_distance > self.app_state['speed_threshold']:
+            self.apply_flicker()
+            self.flicker_until = time.monotonic()
+            self.reset_motion_window()
+
+    def reset_motion_window(self):
+        """Forgets the motion summed over the current flicker interval."""
+        # (server_time, distance) steps from the last FLICKER_INTERVAL_MS of motion
+        self.motion_window = deque()
+        self.motion_window_distance = 0.0
+
+    def refresh_effects_active(self):
+        """
+        Keeps `effects_active` current for the motion listener thread, which
+        must not call into Tk itself. Falls back to polling if the listener
+        stops delivering events.
+        """
+        if self.app_state['stop_flag'].is_set():
+            return
+
+        self.effects_active = self.is_effect_active()
+        if self.motion_listener.running:
+            self.root.after(FLICKER_INTERVAL_MS, self.refresh_effects_active)
+        else:
+            print("Warning: Pointer motion events stopped. Falling back to polling.")
+            self.effects_active = False
+            self.flicker_effect()
+
+    def start_flicker(self):
+        """
+        Runs `apply_flicker` on a worker thread, so pyautogui's pauses
+        (about 0.2 s per flicker) never block the Tk event loop.
+        """
+        if not self.flicker_lock.acquire(blocking=False):
+            return # A flicker is already running
+
+        def run():
+            try:
+                self.apply_flicker()
+            finally:
+                self.flicker_lock.release()
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def apply_flicker(self):
+        """Shakes the real cursor sideways by the flicker intensity."""
+        offset = self.app_state['flicker_intensity']
+        if self.injector.running:
+            self.injector.play([(offset, 0), (-offset, 0)], duration=0.02, relative=True)
+        else:
+            pyautogui.moveRel(offset, 0, duration=0.01)
+            pyautogui.moveRel(-offset, 0, duration=0.01)
 
     def chaotic_mouse_movement(self):
         """
@@ -402,15 +616,28 @@ class ChaoticMouseApp:
 
             # Occasionally perform a rapid jitter motion
             if random.random() < 0.25:
-                for _ in range(random.randint(10, 25)):
-                    if not self.is_effect_active(): break
-
-                    jitter_x = max(0, min(screen_width - 1, x + random.randint(-20, 20)))
-                    jitter_y = max(0, min(screen_height - 1, y + random.randint(-20, 20)))
-                    pyautogui.moveTo(jitter_x, jitter_y, duration=0.005)
+                jitter = [
+                    (max(0, min(screen_width - 1, x + random.randint(-20, 20))),
+                     max(0, min(screen_height - 1, y + random.randint(-20, 20))))
+                    for _ in range(random.randint(10, 25))
+                ]
+                if self.injector.running:
+                    # The whole burst is scheduled up front, one flush per frame
+                    self.injector.play(
+                        jitter, duration=len(jitter) * JITTER_STEP,
+                        cancelled=lambda: not self.is_effect_active()
+                    )
+                else:
+                    for jitter_x, jitter_y in jitter:
+                        if not self.is_effect_active(): break
+                        pyautogui.moveTo(jitter_x, jitter_y, duration=0.005)
                 time.sleep(0.05)
             else: # Otherwise, perform a smooth move
-                pyautogui.moveTo(x, y, duration=random.uniform(0.005, 0.7))
+                duration = random.uniform(0.005, 0.7)
+                if self.injector.running:
+                    self.injector.glide(x, y, duration)
+                else:
+                    pyautogui.moveTo(x, y, duration=duration)
 
             time.sleep(random.uniform(0.05, 1.2))
 
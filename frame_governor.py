@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""
+Adaptive quality governor that holds a frame-time budget.
+
+The governor runs a heartbeat on the Tkinter event loop against fixed
+deadlines at the target frame rate. Its lateness is the average time per
+frame by which the beats fall behind that schedule (actual minus scheduled
+interval), taken over a short window of beats. Because the deadlines are
+fixed, timer granularity (15.6 ms ticks on Windows) averages out, so an idle
+event loop measures close to zero. Each beat interval is capped before
+averaging, so an isolated stall (e.g. a blocking call on the Tk thread)
+cannot by itself outweigh a window of otherwise punctual frames. When other callbacks take longer than
+the frame budget allows, the beats fall behind and the quality level steps
+down. Once the loop keeps pace again, the governor tries the next level up.
+Effects read `FrameGovernor.quality` (1.0 at full quality) to scale their
+update rate, density or frequency.
+
+Hysteresis keeps the level from oscillating: stepping down needs a short run
+of late frames, stepping up needs a much longer run of frames on schedule,
+and that run doubles for a level each time restoring it has to be undone
+soon afterwards.
+"""
+
+import time
+from collections import deque
+
+# Quality factor for each degradation level, from full quality downwards
+QUALITY_LEVELS = (1.0, 0.75, 0.5, 0.35, 0.25)
+LEVEL_NAMES = ("full", "high", "medium", "low", "minimal")
+
+DEFAULT_TARGET_FPS = 30
+# Beats averaged per lateness measurement; divides timer granularity error
+LATENESS_WINDOW = 10
+# A single beat interval counts as at most this many frame budgets
+MAX_BEAT_BUDGETS = 2
+# Smoothed lateness above budget * DEGRADE_RATIO counts as over budget,
+# below budget * RESTORE_RATIO counts as keeping pace
+DEGRADE_RATIO = 0.15
+RESTORE_RATIO = 0.05
+# Consecutive frames needed before changing level; longer than the window,
+# so one slow beat alone can never complete a degrade run
+DEGRADE_FRAMES = 2 * LATENESS_WINDOW
+RESTORE_FRAMES = 60
+# A degrade within this many frames of a restore doubles the frames needed
+# to restore that level again, up to RESTORE_FRAMES * MAX_RESTORE_BACKOFF
+FLAP_FRAMES = 300
+MAX_RESTORE_BACKOFF = 64
+# Weight of the newest frame in the smoothed lateness
+SMOOTHING = 0.2
+
+
+class FrameGovernor:
+    """
+    Measures frame lateness on the Tk event loop and adjusts a quality level.
+    """
+
+    def __init__(self, root, target_fps=DEFAULT_TARGET_FPS, on_change=None):
+        """
+        Initializes the governor at full quality without starting it.
+
+        Args:
+            root: The tk.Tk() instance whose event loop is measured.
+            target_fps (int): The frame rate the governor tries to hold.
+            on_change (callable): Called with the new level whenever it changes.
+        """
+        self.root = root
+        self.on_change = on_change
+        self.level = 0
+        self.lateness = 0.0
+        # Frames on schedule needed to restore each level
+        self.restore_frames = [RESTORE_FRAMES] * len(QUALITY_LEVELS)
+        self._over = 0
+        self._under = 0
+        self._frames_since_restore = None
+        self._deadline = None
+        # Capped intervals between the last LATENESS_WINDOW beats
+        self._intervals = deque(maxlen=LATENESS_WINDOW)
+        self._last_beat = None
+        self._after_id = None
+        self.set_target_fps(target_fps)
+
+    @property
+    def quality(self):
+        """The quality factor for the current level (1.0 is full quality)."""
+        return QUALITY_LEVELS[self.level]
+
+    def set_target_fps(self, target_fps):
+        """
+        Changes the target frame rate and restarts the hysteresis counters.
+
+        Args:
+            target_fps (int): The new frame rate to hold.
+        """
+        self.target_fps = target_fps
+        self.budget = 1.0 / target_fps
+        self.lateness = 0.0
+        self._over = self._under = 0
+        self._intervals.clear()
+
+    def describe(self):
+        """Returns a short human-readable report of the current level."""
+        return f"Quality: {LEVEL_NAMES[self.level]} (level {self.level})"
+
+    def start(self):
+        """Starts the heartbeat on the Tk event loop."""
+        now = time.perf_counter()
+        self._intervals.clear()
+        self._last_beat = now
+        self._deadline = now + self.budget
+        self._schedule(now)
+
+    def stop(self):
+        """Cancels the pending heartbeat."""
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def record(self, lateness):
+        """
+        Feeds one measured frame lateness into the governor.
+
+        Args:
+            lateness (float): Average seconds per frame by which the beats
+                fell behind schedule; negative when ahead.
+
+        Returns:
+            int: The degradation level after this frame.
+        """
+        self.lateness += SMOOTHING * (lateness - self.lateness)
+        if self._frames_since_restore is not None:
+            self._frames_since_restore += 1
+
+        if self.lateness > self.budget * DEGRADE_RATIO:
+            self._over += 1
+            self._under = 0
+        elif self.lateness < self.budget * RESTORE_RATIO:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = self._under = 0
+
+        if self._over >= DEGRADE_FRAMES and self.level < len(QUALITY_LEVELS) - 1:
+            # Degrading soon after a restore means this level could not be
+            # held; wait longer before trying it again
+            if self._frames_since_restore is not None and self._frames_since_restore < FLAP_FRAMES:
+                self.restore_frames[self.level] = min(
+                    self.restore_frames[self.level] * 2, RESTORE_FRAMES * MAX_RESTORE_BACKOFF
+                )
+            self._frames_since_restore = None
+            self._set_level(self.level + 1)
+        elif self.level > 0 and self._under >= self.restore_frames[self.level - 1]:
+            self._frames_since_restore = 0
+            self._set_level(self.level - 1)
+        elif self._frames_since_restore is not None and self._frames_since_restore >= FLAP_FRAMES:
+            # The restored level held, so it need not wait as long next time
+            self.restore_frames[self.level] = RESTORE_FRAMES
+            self._frames_since_restore = None
+        return self.level
+
+    def _set_level(self, level):
+        """Switches level and starts a fresh run of measurements."""
+        self.level = level
+        self._over = self._under = 0
+        if self.on_change:
+            self.on_change(level)
+
+    def _schedule(self, now):
+        """Schedules the next beat for the current deadline."""
+        delay_ms = max(1, int((self._deadline - now) * 1000))
+        self._after_id = self.root.after(delay_ms, self._tick)
+
+    def _beat(self, now):
+        """Measures the beat that fired at `now` and advances the deadline."""
+        self._intervals.append(min(now - self._last_beat, self.budget * MAX_BEAT_BUDGETS))
+        self._last_beat = now
+        if len(self._intervals) == LATENESS_WINDOW:
+            frame_time = sum(self._intervals) / LATENESS_WINDOW
+            self.record(frame_time - self.budget)
+        self._deadline += self.budget
+        if self._deadline <= now:
+            # A whole frame was missed; resync instead of firing catch-up beats
+            self._deadline = now + self.budget
+
+    def _tick(self):
+        """Heartbeat: measures this beat and schedules the next one."""
+        now = time.perf_counter()
+        self._beat(now)
+        self._schedule(now)
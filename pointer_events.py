@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""
+Event-driven pointer motion input for Linux.
+
+Instead of polling `pyautogui.position()` on a timer, this module subscribes
+to the X server's RECORD extension and receives every pointer motion event,
+including synthetic ones injected through XTest (so it can be exercised under
+Xvfb). Each event is turned into a timestamped `MotionSample` and handed to a
+callback on a dedicated dispatch thread, which sleeps while the pointer is
+still.
+
+Dependencies:
+- python-xlib (optional): Without it, or without an X display that offers
+  RECORD (e.g. on Windows), `PointerMotionListener.start()` returns False and
+  callers should fall back to polling.
+"""
+
+import queue
+import threading
+import time
+import traceback
+from collections import namedtuple
+
+try:
+    from Xlib import X, display
+    from Xlib.error import DisplayError
+    from Xlib.ext import record
+    from Xlib.protocol import rq
+except ImportError:
+    display = None
+
+# A single pointer motion event.
+#   x, y:        Root window coordinates of the pointer.
+#   server_time: X server timestamp in milliseconds.
+#   received:    time.monotonic() when the event reached this process.
+MotionSample = namedtuple("MotionSample", ["x", "y", "server_time", "received"])
+
+# Samples held while the callback is busy; older ones are dropped beyond this
+MAX_PENDING_SAMPLES = 1000
+
+
+class PointerMotionListener:
+    """
+    Streams pointer motion events from the X server to a callback.
+
+    Two threads are used: one blocks inside the RECORD connection and only
+    parses and queues samples, the other delivers them to the callback. A
+    slow callback (e.g. one that moves the pointer itself) therefore never
+    stalls the X connection, and samples keep the time they actually arrived.
+    """
+
+    def __init__(self, on_motion):
+        """
+        Initializes the listener without connecting to the X server.
+
+        Args:
+            on_motion (callable): Called with a MotionSample for each event,
+                from the listener's dispatch thread.
+        """
+        self.on_motion = on_motion
+        self.samples = queue.Queue(maxsize=MAX_PENDING_SAMPLES)
+        self._control = None
+        self._record = None
+        self._context = None
+        self._record_thread = None
+        self._dispatch_thread = None
+
+    @property
+    def running(self):
+        """True while the listener is receiving and delivering events."""
+        return all(
+            thread is not None and thread.is_alive()
+            for thread in (self._record_thread, self._dispatch_thread)
+        )
+
+    def start(self):
+        """
+        Connects to the X server and starts listening for motion events.
+
+        Returns:
+            bool: False if python-xlib, the display or RECORD is unavailable.
+        """
+        if display is None:
+            return False
+        try:
+            self._control = display.Display()
+            self._record = display.Display()
+        except DisplayError:
+            return False
+        if not self._control.has_extension("RECORD"):
+            self._close_displays()
+            return False
+
+        self._context = self._control.record_create_context(
+            0,
+            [record.AllClients],
+            [{
+                'core_requests': (0, 0),
+                'core_replies': (0, 0),
+                'ext_requests': (0, 0, 0, 0),
+                'ext_replies': (0, 0, 0, 0),
+                'delivered_events': (0, 0),
+                'device_events': (X.MotionNotify, X.MotionNotify),
+                'errors': (0, 0),
+                'client_started': False,
+                'client_died': False,
+            }],
+        )
+
+        self._record_thread = threading.Thread(target=self._record_loop, daemon=True)
+        self._dispatch_thread = threading.Thread(target=self._dispatch_loop, daemon=True)
+        self._dispatch_thread.start()
+        self._record_thread.start()
+        return True
+
+    def stop(self, timeout=1):
+        """
+        Stops listening and closes the X connections.
+
+        Args:
+            timeout (float): Seconds to wait for each thread to finish.
+        """
+        if self._context is None:
+            return
+        self._control.record_disable_context(self._context)
+        self._control.flush()
+        if self._record_thread:
+            self._record_thread.join(timeout=timeout)
+        # Wake the dispatch thread so it can exit
+        self._enqueue(None)
+        if self._dispatch_thread:
+            self._dispatch_thread.join(timeout=timeout)
+        self._control.record_free_context(self._context)
+        self._context = None
+        self._close_displays()
+
+    def _close_displays(self):
+        """Closes both X connections, ignoring ones that were never opened."""
+        for conn in (self._record, self._control):
+            if conn is not None:
+                conn.close()
+        self._control = self._record = None
+
+    def _record_loop(self):
+        """Blocks in the RECORD connection until the context is disabled."""
+        self._record.record_enable_context(self._context, self._handle_reply)
+
+    def _handle_reply(self, reply):
+        """Parses a RECORD reply and queues any motion events it contains."""
+        received = time.monotonic()
+        if reply.category != record.FromServer or reply.client_swapped:
+            return
+        data = reply.data
+        if not data or data[0] < 2:
+            # Not an event (0 is an error, 1 is a reply)
+            return
+
+        while len(data):
+            event, data = rq.EventField(None).parse_binary_value(
+                data, self._record.display, None, None
+            )
+            if event.type == X.MotionNotify:
+                self._enqueue(MotionSample(event.root_x, event.root_y, event.time, received))
+
+    def _enqueue(self, sample):
+        """Queues a sample, dropping the oldest pending one if the queue is full."""
+        while True:
+            try:
+                self.samples.put_nowait(sample)
+                return
+            except queue.Full:
+                try:
+                    self.samples.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _dispatch_loop(self):
+        """Delivers queued samples to the callback; idle while none arrive."""
+        while True:
+            sample = self.samples.get()
+            if sample is None:
+                return
+            try:
+                self.on_motion(sample)
+            except Exception:
+                # Keep delivering events; one failing callback must not
+                # silently end the listener
+                print("Warning: Pointer motion callback failed:")
+                traceback.print_exc()
+
+
+if __name__ == "__main__":
+    # Quick manual check, e.g. under Xvfb: move the pointer (or inject XTest
+    # motion) and watch the samples arrive.
+    listener = PointerMotionListener(print)
+    if not listener.start():
+        print("Pointer motion events are not available on this display.")
+    else:
+        print("Listening for pointer motion. Press Ctrl+C to stop.")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            listener.stop()
@@ -0,0 +1,235 @@
+# -*- coding: utf-8 -*-
+"""
+Batched, low-overhead pointer injection for Linux.
+
+`pyautogui.moveTo`/`moveRel` run a fail-safe check, an optional tween and a
+`pyautogui.PAUSE` sleep around every single move. This module instead keeps
+one X display connection open and injects moves through the XTest
+extension: a whole list of absolute or relative moves is written to the
+connection and sent with a single flush per frame, and longer sequences are
+spread across frames scheduled against `time.monotonic()`.
+
+Run this file directly (e.g. under Xvfb) to measure the per-point overhead
+and the sustained injection rate.
+
+Dependencies:
+- python-xlib (optional): Without it, or without an X display that offers
+  XTEST (e.g. on Windows), `PointerInjector.start()` returns False and
+  callers should fall back to pyautogui.
+"""
+
+import math
+import threading
+import time
+
+try:
+    from Xlib import X, display
+    from Xlib.error import DisplayError
+    from Xlib.ext import xtest
+except ImportError:
+    display = None
+
+DEFAULT_FRAME_RATE = 120
+
+
+class PointerInjector:
+    """
+    Injects pointer motion through XTest on a persistent display connection.
+
+    All methods are safe to call from several threads; each batch is written
+    and flushed under a lock so batches from different threads never mix.
+    """
+
+    def __init__(self, frame_rate=DEFAULT_FRAME_RATE, clock=time.monotonic, sleep=time.sleep):
+        """
+        Initializes the injector without connecting to the X server.
+
+        Args:
+            frame_rate (int): Frames per second used by `play` and `glide`.
+            clock (callable): Monotonic clock in seconds used to schedule frames.
+            sleep (callable): Waits the given number of seconds between frames.
+        """
+        self.frame_interval = 1.0 / frame_rate
+        self._clock = clock
+        self._sleep = sleep
+        self._display = None
+        self._root = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self):
+        """True while the injector holds an open display connection."""
+        return self._display is not None
+
+    def start(self):
+        """
+        Opens the display connection used for all injected moves.
+
+        Returns:
+            bool: False if python-xlib, the display or XTEST is unavailable.
+        """
+        if display is None:
+            return False
+        try:
+            self._display = display.Display()
+        except DisplayError:
+            return False
+        if not self._display.has_extension("XTEST"):
+            self.stop()
+            return False
+        self._root = self._display.screen().root
+        return True
+
+    def stop(self):
+        """Closes the display connection."""
+        with self._lock:
+            if self._display is not None:
+                self._display.close()
+            self._display = self._root = None
+
+    def position(self):
+        """Returns the current pointer position as an (x, y) tuple."""
+        with self._lock:
+            pointer = self._root.query_pointer()
+        return pointer.root_x, pointer.root_y
+
+    def send(self, points, relative=False):
+        """
+        Injects a sequence of moves and sends them with one flush.
+
+        Args:
+            points (iterable): (x, y) positions, or (dx, dy) offsets if relative.
+            relative (bool): Treat the points as offsets from the current position.
+        """
+        detail = 1 if relative else 0
+        with self._lock:
+            for x, y in points:
+                xtest.fake_input(self._display, X.MotionNotify, detail=detail, x=int(x), y=int(y))
+            self._display.flush()
+
+    def play(self, points, duration, relative=False, cancelled=None):
+        """
+        Spreads a sequence of moves evenly over a duration, one flush per frame.
+
+        Point i is sent in frame floor(i * frames / len(points)), so the
+        first point goes out immediately and the call returns right after
+        the last send. Frame deadlines are computed from a single monotonic
+        start time, so slow frames do not push the rest of the sequence back;
+        points from frames that are already overdue go out in one batch.
+
+        Args:
+            points (list): (x, y) positions, or (dx, dy) offsets if relative.
+            duration (float): Seconds over which to play the points.
+            relative (bool): Treat the points as offsets from the current position.
+            cancelled (callable): Checked before each frame; playback stops
+                once it returns True.
+
+        Returns:
+            bool: False if playback was cancelled before the last point.
+        """
+        if not points:
+            return True
+        if duration <= 0:
+            self.send(points, relative)
+            return True
+
+        start = self._clock()
+        frames = max(1, math.ceil(duration / self.frame_interval))
+        sent = 0
+        frame = 0
+        while True:
+            if cancelled is not None and cancelled():
+                return False
+            # Number of points whose frame is at or before this one
+            due = min(len(points), -(-(frame + 1) * len(points) // frames))
+            if due > sent:
+                self.send(points[sent:due], relative)
+                sent = due
+            if sent >= len(points):
+                return True
+            # Skip straight to the current frame if we have fallen behind
+            frame = max(frame + 1, int((self._clock() - start) * frames / duration))
+            delay = start + frame * duration / frames - self._clock()
+            if delay > 0:
+                self._sleep(delay)
+
+    def glide(self, x, y, duration, cancelled=None):
+        """
+        Moves the pointer in a straight line to (x, y), one point per pixel.
+
+        Args:
+            x (int): The target x-coordinate.
+            y (int): The target y-coordinate.
+            duration (float): Seconds the movement should take.
+            cancelled (callable): See `play`.
+
+        Returns:
+            bool: False if the movement was cancelled before reaching (x, y).
+        """
+        start_x, start_y = self.position()
+        steps = max(1, abs(x - start_x), abs(y - start_y))
+        points = [
+            (start_x + (x - start_x) * i // steps, start_y + (y - start_y) * i // steps)
+            for i in range(1, steps + 1)
+        ]
+        return self.play(points, duration, cancelled=cancelled)
+
+
+def _meets_deadlines(injector, batch, frames):
+    """
+    Sends `batch` points per frame for `frames` frames.
+
+    Returns:
+        bool: True if every batch was processed by the server before the
+        next frame's deadline.
+    """
+    points = [(i % 500, (i * 7) % 500) for i in range(batch)]
+    start = time.monotonic()
+    for frame in range(1, frames + 1):
+        injector.send(points)
+        injector.position()  # Round trip so the server has processed the batch
+        deadline = start + frame * injector.frame_interval
+        now = time.monotonic()
+        if now > deadline:
+            return False
+        time.sleep(deadline - now)
+    return True
+
+
+def benchmark(count=20000, frames=60):
+    """
+    Prints the per-point cost of `send` and the largest batch per frame that
+    still meets every frame deadline.
+
+    Args:
+        count (int): How many points to inject for the per-point cost.
+        frames (int): How many consecutive frames a batch size must sustain.
+    """
+    injector = PointerInjector()
+    if not injector.start():
+        print("XTest pointer injection is not available on this display.")
+        return
+
+    points = [(i % 500, (i * 7) % 500) for i in range(count)]
+    start = time.perf_counter()
+    injector.send(points)
+    injector.position()  # Round trip so the server has processed the batch
+    elapsed = time.perf_counter() - start
+    print(f"send: {count} points in {elapsed * 1000:.1f} ms "
+          f"({elapsed / count * 1e6:.2f} us per point)")
+
+    # Double the batch until a frame misses its deadline
+    best = 0
+    batch = 1
+    while batch <= 1 << 20 and _meets_deadlines(injector, batch, frames):
+        best = batch
+        batch *= 2
+    rate = best / injector.frame_interval
+    print(f"sustained: {best} points per frame at {1 / injector.frame_interval:.0f} FPS "
+          f"({rate:.0f} points per second)")
+
+    injector.stop()
+
+
+if __name__ == "__main__":
+    benchmark()
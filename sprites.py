@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Shared sprite cache for fake cursors.
+
+Each (shape, size, color) combination is rendered once into a Tkinter
+`PhotoImage`. Every fake cursor then points its canvas image item at the
+cached sprite, so changing a shape or color is a single `itemconfig` call
+instead of deleting and redrawing canvas primitives.
+
+The sprites are painted on a black background, which the fake cursor
+windows already treat as their transparent color.
+"""
+
+import tkinter as tk
+
+SHAPES = ("dot", "square", "cross")
+BACKGROUND = "black"
+
+
+def _covers(shape, size, x, y):
+    """
+    Returns True if the pixel centre (x, y) is inside the given shape.
+
+    Args:
+        shape (str): The shape to test ('dot', 'square', 'cross').
+        size (int): The width and height of the sprite in pixels.
+        x (float): The x-coordinate of the pixel centre.
+        y (float): The y-coordinate of the pixel centre.
+    """
+    if shape == "square":
+        return True
+    if shape == "cross":
+        middle = size / 2
+        return abs(x - middle) <= 1 or abs(y - middle) <= 1
+    # Default to dot
+    radius = size / 2
+    return (x - radius) ** 2 + (y - radius) ** 2 <= radius ** 2
+
+
+class SpriteCache:
+    """
+    Renders and stores one `PhotoImage` per (shape, size, color) combination.
+
+    The cache also keeps the only strong reference to each image, which
+    Tkinter requires to stop the image from being garbage collected while a
+    canvas is still displaying it.
+    """
+
+    def __init__(self, master):
+        """
+        Initializes an empty sprite cache.
+
+        Args:
+            master: The tk.Tk() instance the images belong to.
+        """
+        self.master = master
+        self._sprites = {}
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def get(self, shape, size, color="white"):
+        """
+        Returns the sprite for the given combination, rendering it on first use.
+
+        Args:
+            shape (str): The shape of the sprite ('dot', 'square', 'cross').
+            size (int): The width and height of the sprite in pixels.
+            color (str): A Tk color name or '#rrggbb' string.
+        """
+        key = (shape, size, color)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._render(shape, size, color)
+            self._sprites[key] = sprite
+        return sprite
+
+    def preload(self, shapes, size, color="white"):
+        """
+        Renders several shapes up front so later lookups never draw.
+
+        Args:
+            shapes (iterable): The shapes to render.
+            size (int): The width and height of the sprites in pixels.
+            color (str): A Tk color name or '#rrggbb' string.
+        """
+        for shape in shapes:
+            self.get(shape, size, color)
+
+    def _render(self, shape, size, color):
+        """Paints a single sprite row by row into a new `PhotoImage`."""
+        image = tk.PhotoImage(master=self.master, width=size, height=size)
+        rows = []
+        for y in range(size):
+            row = [
+                color if _covers(shape, size, x + 0.5, y + 0.5) else BACKGROUND
+                for x in range(size)
+            ]
+            rows.append("{" + " ".join(row) + "}")
+        image.put(" ".join(rows), to=(0, 0))
+        return image
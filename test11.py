@@ -7,6 +7,11 @@ import tkinter as tk
 import sys
 import math
 
+from frame_governor import DEFAULT_TARGET_FPS, FrameGovernor
+from pointer_events import PointerMotionListener
+from pointer_inject import PointerInjector
+from sprites import SpriteCache
+
 # --- Windows API constants ---
 SPI_SETMOUSESPEED = 200
 SPI_GETMOUSESPEED = 300
@@ -35,9 +40,10 @@ def random_color():
     return f'#{r:02x}{g:02x}{b:02x}'
 
 class FakeCursor(tk.Toplevel):
-    def __init__(self, root, size=10):
+    def __init__(self, root, sprites, size=10):
         super().__init__(root)
         self.size = size
+        self.sprites = sprites
         self.overrideredirect(True)
         self.attributes("-topmost", True)
         self.config(bg="black")
@@ -47,7 +53,9 @@ class FakeCursor(tk.Toplevel):
         self.canvas = tk.Canvas(self, width=size, height=size, bg="black", highlightthickness=0)
         self.canvas.pack()
         self.color = random_color()
-        self.dot = self.canvas.create_oval(2, 2, size-2, size-2, fill=self.color, outline=self.color)
+        # Dot sprite is inset by 2px on each side, centred in the canvas
+        self.dot = self.canvas.create_image(size // 2, size // 2, anchor="center")
+        self.canvas.itemconfig(self.dot, image=self.sprites.get("dot", size - 4, self.color))
 
         self.alpha = 1.0
         self.pulse_direction = 1  # 1 for increasing brightness, -1 for decreasing
@@ -60,7 +68,9 @@ class FakeCursor(tk.Toplevel):
     def pulse(self):
         # Pulse effect for brightness
         step = 0.05 * self.pulse_direction
-        self.alpha += step
+        # Round so the alpha only takes the 11 levels between 0.5 and 1.0,
+        # which keeps the number of cached sprites per color bounded
+        self.alpha = round(self.alpha + step, 2)
         if self.alpha >= 1.0:
             self.alpha = 1.0
             self.pulse_direction = -1
@@ -73,7 +83,7 @@ class FakeCursor(tk.Toplevel):
         g = int(int(self.color[3:5],16) * self.alpha)
         b = int(int(self.color[5:7],16) * self.alpha)
         new_color = f'#{r:02x}{g:02x}{b:02x}'
-        self.canvas.itemconfig(self.dot, fill=new_color, outline=new_color)
+        self.canvas.itemconfig(self.dot, image=self.sprites.get("dot", self.size - 4, new_color))
 
 class CursorTrailDot(tk.Canvas):
     def __init__(self, root, x, y, size=6, color="#FFFFFF"):
@@ -102,13 +112,43 @@ fake_cursors = []
 trail_dots = []
 last_mouse_pos = None
 scratch_lock = threading.Lock()
+# Distance travelled since the last mouse_speed() call, fed by motion events
+motion_lock = threading.Lock()
+motion_distance = 0.0
+motion_listener = None
+injector = PointerInjector()
+# Lowers cursor update rate, pulse frequency, trail density and flash rate when frames run long
+governor = None
+target_fps = DEFAULT_TARGET_FPS
+pulse_credit = 0.0
+last_flash = 0.0
+FLASH_INTERVAL = 0.1  # seconds between flashes, divided by quality, once degraded
+
+def quality():
+    return governor.quality if governor is not None else 1.0
+
+def on_quality_change(level):
+    print(governor.describe())
 
 def play_scratch_sound():
     # Sound disabled since pygame removed
     pass
 
+def on_pointer_motion(sample):
+    # Called for every real motion event; sums the whole path between polls
+    global last_mouse_pos, motion_distance
+    with motion_lock:
+        if last_mouse_pos is not None:
+            motion_distance += math.dist(last_mouse_pos, (sample.x, sample.y))
+        last_mouse_pos = (sample.x, sample.y)
+
 def mouse_speed():
-    global last_mouse_pos
+    global last_mouse_pos, motion_distance
+    if motion_listener is not None and motion_listener.running:
+        with motion_lock:
+            dist = motion_distance
+            motion_distance = 0.0
+        return dist
     x, y = pyautogui.position()
     if last_mouse_pos is None:
         last_mouse_pos = (x, y)
@@ -118,8 +158,14 @@ def mouse_speed():
     return dist
 
 def flash_screen(root):
+    global last_flash
     if not flash_enabled:
         return
+    now = time.monotonic()
+    # Only throttle while degraded; full quality flashes as before
+    if governor is not None and governor.level > 0 and now - last_flash < FLASH_INTERVAL / quality():
+        return
+    last_flash = now
     flash = tk.Toplevel(root)
     flash.overrideredirect(True)
     flash.attributes("-topmost", True)
@@ -129,22 +175,32 @@ def flash_screen(root):
     flash.after(100, flash.destroy)
 
 def move_fake_cursors(root):
+    global pulse_credit
     if stop_flag:
         for c in fake_cursors:
             c.destroy()
         return
+    # Pulse on a quality() fraction of updates, so every level lowers the rate
+    pulse_credit += quality()
+    pulse_now = pulse_credit >= 1.0
+    if pulse_now:
+        pulse_credit -= 1.0
     for c in fake_cursors:
         margin = 100 + effect_intensity * 20
         x = random.randint(-margin, screen_width + margin)
         y = random.randint(-margin, screen_height + margin)
         c.move_to(x, y)
-        c.pulse()
+        if pulse_now:
+            c.pulse()
 
-    root.after(50, lambda: move_fake_cursors(root))
+    root.after(int(50 / quality()), lambda: move_fake_cursors(root))
 
 def create_trail_dot(root, x, y):
     if not trail_enabled:
         return
+    # Thin out the trail at lower quality
+    if random.random() > quality():
+        return
     color = random_color()
     dot = CursorTrailDot(root, x, y, size=8, color=color)
     trail_dots.append(dot)
@@ -179,7 +235,10 @@ def chaotic_mouse_movement(root):
 
             create_trail_dot(root, x, y)
 
-            pyautogui.moveTo(x, y, duration=0.01)
+            if injector.running:
+                injector.send([(x, y)])
+            else:
+                pyautogui.moveTo(x, y, duration=0.01)
 
             time.sleep(max(0.01, 0.1 - effect_intensity * 0.01))
 
@@ -191,7 +250,7 @@ def chaotic_mouse_movement(root):
         sys.exit()
 
 def on_key_press(event):
-    global effect_intensity, effect_enabled, trail_enabled, flash_enabled, sound_enabled, stop_flag
+    global effect_intensity, effect_enabled, trail_enabled, flash_enabled, sound_enabled, stop_flag, target_fps
     if event.char == '+':
         effect_intensity = min(10, effect_intensity + 1)
         print(f"Intensity increased to {effect_intensity}")
@@ -207,15 +266,22 @@ def on_key_press(event):
     elif event.char == 's':
         sound_enabled = not sound_enabled
         print(f"Sound {'enabled' if sound_enabled else 'disabled'}")
+    elif event.char in ('[', ']'):
+        step = 5 if event.char == ']' else -5
+        target_fps = max(10, min(60, target_fps + step))
+        if governor is not None:
+            governor.set_target_fps(target_fps)
+        print(f"Target FPS set to {target_fps}")
     elif event.char == 'q':
         print("Exiting...")
         stop_flag = True
 
 def main():
-    global stop_flag
+    global stop_flag, motion_listener, governor
     print("Chaotic DJ Cursor Madness — Press Ctrl+C to stop.")
     print("Use + / - to change intensity (1-10)")
     print("Toggle trail (t), flash (f), sound (s), quit (q)")
+    print("Use [ / ] to change target FPS (10-60)")
 
     pyautogui.FAILSAFE = False
 
@@ -226,12 +292,22 @@ def main():
     root.bind("<Key>", on_key_press)
     root.deiconify()
 
+    sprites = SpriteCache(root)
     for _ in range(8):
-        fc = FakeCursor(root, size=12)
+        fc = FakeCursor(root, sprites, size=12)
         fake_cursors.append(fc)
 
+    governor = FrameGovernor(root, target_fps, on_change=on_quality_change)
+    governor.start()
+
     move_fake_cursors(root)
 
+    motion_listener = PointerMotionListener(on_pointer_motion)
+    if not motion_listener.start():
+        motion_listener = None  # no X server motion events, poll instead
+
+    injector.start()  # falls back to pyautogui when XTest is unavailable
+
     movement_thread = threading.Thread(target=chaotic_mouse_movement, args=(root,), daemon=True)
     movement_thread.start()
 
@@ -239,6 +315,9 @@ def main():
         root.mainloop()
     except KeyboardInterrupt:
         stop_flag = True
+        if motion_listener is not None:
+            motion_listener.stop()
+        injector.stop()
         set_mouse_speed(10)
         print("Mouse speed reset to normal. Exiting.")
         sys.exit()
@@ -0,0 +1,64 @@
+"""
+Shared fixtures for tests that need an X display.
+
+Tests use the display in $DISPLAY if there is one, otherwise they start a
+private Xvfb server. When neither is available they are skipped.
+"""
+
+import importlib
+import os
+import shutil
+import subprocess
+import sys
+import time
+import types
+
+import pytest
+
+# The scripts live in the repository root, next to this directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+XVFB_DISPLAY = ":99"
+
+
+@pytest.fixture(scope="session")
+def x_display():
+    """Yields the name of a usable X display."""
+    if os.environ.get("DISPLAY"):
+        yield os.environ["DISPLAY"]
+        return
+
+    if shutil.which("Xvfb") is None:
+        pytest.skip("needs an X display or Xvfb")
+
+    server = subprocess.Popen(
+        ["Xvfb", XVFB_DISPLAY, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    os.environ["DISPLAY"] = XVFB_DISPLAY
+    # Wait for the server socket to appear
+    socket_path = f"/tmp/.X11-unix/X{XVFB_DISPLAY[1:]}"
+    deadline = time.monotonic() + 5
+    while not os.path.exists(socket_path) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    try:
+        yield XVFB_DISPLAY
+    finally:
+        server.terminate()
+        server.wait(timeout=5)
+        del os.environ["DISPLAY"]
+
+
+@pytest.fixture
+def final(monkeypatch):
+    """Imports Final.py with pyautogui and the Windows mouse speed call stubbed."""
+    stub = types.ModuleType("pyautogui")
+    stub.FAILSAFE = True
+    stub.size = lambda: (1280, 1024)
+    stub.position = lambda: (640, 512)
+    stub.moveTo = stub.moveRel = lambda *args, **kwargs: None
+    monkeypatch.setitem(sys.modules, "pyautogui", stub)
+    monkeypatch.delitem(sys.modules, "Final", raising=False)
+    module = importlib.import_module("Final")
+    monkeypatch.setattr(module, "set_mouse_speed", lambda speed: None)
+    return module
@@ -0,0 +1,92 @@
+"""
+Soak test for the fake cursor lifecycle in Final.py.
+
+Moves the cursor-count slider thousands of times and checks that pending Tk
+timers, Python memory and live FakeCursor objects stay bounded.
+Needs an X display; conftest starts a private Xvfb when $DISPLAY is unset:
+
+    python -m pytest tests/test_cursor_lifecycle.py
+"""
+
+import gc
+import random
+import tracemalloc
+
+import pytest
+
+tk = pytest.importorskip("tkinter")
+
+SLIDER_MOVES = 3000
+# Pump the event loop after this many slider moves
+PUMP_EVERY = 10
+MAX_CURSORS = 15
+
+
+@pytest.fixture
+def app(x_display, final):
+    root = tk.Tk()
+    app = final.ChaoticMouseApp(root)
+    app.governor.start()
+    yield app
+    app.governor.stop()
+    root.destroy()
+
+
+def pending_timers(root):
+    return len(root.tk.splitlist(root.tk.call("after", "info")))
+
+
+def live_fake_cursors(final):
+    gc.collect()
+    return sum(1 for obj in gc.get_objects() if isinstance(obj, final.FakeCursor))
+
+
+def move_slider(app, moves, rng):
+    for i in range(moves):
+        app.update_num_cursors(rng.randint(1, MAX_CURSORS))
+        if i % PUMP_EVERY == 0:
+            app.root.update()
+    app.root.update()
+
+
+def test_slider_soak_keeps_timers_and_memory_bounded(final, app):
+    rng = random.Random(0)
+    root = app.root
+
+    # Warm up so caches, sprites and widget name counters exist
+    move_slider(app, 200, rng)
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+
+    max_timers = 0
+    for _ in range(SLIDER_MOVES // 100):
+        move_slider(app, 100, rng)
+        # One move per cursor, the governor heartbeat and a pending resize
+        max_timers = max(max_timers, pending_timers(root))
+        assert pending_timers(root) <= len(app.fake_cursors) + 2
+        assert live_fake_cursors(final) == len(app.fake_cursors)
+
+    gc.collect()
+    growth = sum(
+        stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename")
+    )
+    tracemalloc.stop()
+
+    assert max_timers <= MAX_CURSORS + 2
+    assert growth < 256 * 1024
+    # Every cursor left in the swarm still has exactly one move queued
+    assert all(cursor.move_after_id is not None for cursor in app.fake_cursors)
+
+
+def test_removed_cursor_has_no_pending_timer(final, app):
+    app.update_num_cursors(MAX_CURSORS)
+    app.root.update()
+    removed = app.fake_cursors[3:]
+    after_ids = [cursor.move_after_id for cursor in removed]
+
+    app.update_num_cursors(3)
+    app.root.update()
+
+    pending = set(app.root.tk.splitlist(app.root.tk.call("after", "info")))
+    assert not pending & set(after_ids)
+    assert all(cursor.move_after_id is None for cursor in removed)
@@ -0,0 +1,89 @@
+"""
+Tests for the event-driven flicker check in Final.py.
+
+`ChaoticMouseApp.on_pointer_motion` is fed synthetic MotionSamples; the app
+is built without Tk and `apply_flicker` is replaced with a recorder.
+"""
+
+import time
+
+import pytest
+
+from pointer_events import MotionSample
+
+
+class FakeAppState(dict):
+    """Dictionary-backed stand-in for AppState."""
+
+    def update_state(self, key, value):
+        self[key] = value
+
+
+@pytest.fixture
+def app(final):
+    app = final.ChaoticMouseApp.__new__(final.ChaoticMouseApp)
+    app.app_state = FakeAppState(
+        flicker_enabled=True, speed_threshold=15, flicker_intensity=5, last_mouse_pos=None
+    )
+    app.reset_motion_window()
+    app.flicker_until = 0.0
+    app.effects_active = True
+    app.flickers = []
+    app.apply_flicker = lambda: app.flickers.append(app.app_state['last_mouse_pos'])
+    return app
+
+
+def feed(app, points, received=None):
+    """
+    Feeds (x, y, server_time) tuples to the app as motion samples, received
+    now unless `received` is given.
+    """
+    for x, y, server_time in points:
+        at = time.monotonic() if received is None else received
+        app.on_pointer_motion(MotionSample(x, y, server_time, at))
+
+
+def test_slow_glide_in_one_pixel_steps_does_not_flicker(app):
+    # A 100 px glide over 0.7 s, flushed as pairs of 1 px steps that share a
+    # server timestamp; the old per-event estimate read each step as 50 px
+    # per interval
+    points = [(i, 0, 1000 + (i // 2) * 14) for i in range(100)]
+    feed(app, points)
+    assert app.flickers == []
+    assert app.motion_window_distance <= 8
+
+
+def test_fast_motion_sums_steps_over_the_window(app):
+    # 4 px every 8 ms: each step is under the threshold, but the fourth one
+    # takes the window past 15 px, after which the window starts afresh
+    feed(app, [(i * 4, 0, 1000 + i * 8) for i in range(9)])
+    assert app.flickers == [(16, 0), (32, 0)]
+    assert app.motion_window_distance == 0.0
+    assert len(app.motion_window) == 0
+
+
+def test_distance_outside_the_window_is_forgotten(app):
+    app.app_state['speed_threshold'] = 25
+    # 10 px every 30 ms: never more than 20 px within one 50 ms window
+    feed(app, [(i * 10, 0, 1000 + i * 30) for i in range(20)])
+    assert app.flickers == []
+    assert app.motion_window_distance == pytest.approx(20)
+
+
+def test_motion_from_our_own_flicker_is_ignored(app):
+    app.flicker_until = 5.0
+    feed(app, [(i * 50, 0, 1000 + i) for i in range(5)], received=4.0)
+    assert app.flickers == []
+    assert app.app_state['last_mouse_pos'] is None
+
+
+@pytest.mark.parametrize("key, value", [("flicker_enabled", False), ("effects_active", False)])
+def test_no_flicker_while_disabled(app, key, value):
+    if key == "effects_active":
+        app.effects_active = value
+    else:
+        app.app_state[key] = value
+    feed(app, [(i * 50, 0, 1000 + i) for i in range(5)])
+    assert app.flickers == []
+    # Motion is still tracked so re-enabling starts from the real position
+    assert app.app_state['last_mouse_pos'] == (200, 0)
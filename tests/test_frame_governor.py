@@ -0,0 +1,91 @@
+"""Tests for FrameGovernor, driven by a simulated clock instead of Tk."""
+
+import math
+
+import pytest
+
+from frame_governor import DEGRADE_FRAMES, FrameGovernor, RESTORE_FRAMES
+
+
+def simulate(governor, work, frames, tick=0.001):
+    """
+    Runs the governor's heartbeat on a simulated event loop.
+
+    Args:
+        governor (FrameGovernor): The governor under test.
+        work (callable): Seconds of other work after a beat, given the level
+            and the beat's index.
+        frames (int): How many beats to simulate.
+        tick (float): Timer granularity; beats fire on multiples of it.
+    """
+    now = 0.0
+    busy_until = 0.0
+    governor._last_beat = now
+    governor._deadline = governor.budget
+    for frame in range(frames):
+        delay = max(0.001, int((governor._deadline - now) * 1000) / 1000)
+        now = max(now + delay, busy_until)
+        now = math.ceil(now / tick - 1e-9) * tick
+        governor._beat(now)
+        busy_until = now + work(governor.level, frame)
+
+
+def test_idle_with_coarse_windows_timer_stays_at_full_quality():
+    changes = []
+    governor = FrameGovernor(None, 60, on_change=changes.append)
+    simulate(governor, lambda level, frame: 0.0, 2000, tick=0.0156)
+    assert changes == []
+    assert governor.level == 0
+
+
+def test_sustained_overload_degrades_and_recovers():
+    changes = []
+    governor = FrameGovernor(None, 30, on_change=changes.append)
+    simulate(governor, lambda level, frame: 0.06, 200)
+    assert governor.level > 0
+
+    simulate(governor, lambda level, frame: 0.0, 10 * RESTORE_FRAMES)
+    assert governor.level == 0
+
+
+def test_level_dependent_load_settles():
+    # Too slow at full quality, still slightly over budget at level 1
+    load = {0: 0.045, 1: 0.036}
+    changes = []
+    governor = FrameGovernor(None, 30, on_change=changes.append)
+    simulate(governor, lambda level, frame: load.get(level, 0.025), 2000)
+    assert len(changes) <= 4
+    assert governor.level == 1
+
+
+def test_failed_restore_backs_off():
+    governor = FrameGovernor(None, 30)
+    governor.level = 1
+    for _ in range(RESTORE_FRAMES):
+        governor.record(0.0)
+    assert governor.level == 0
+
+    # Falling behind right after the restore doubles its wait
+    for _ in range(DEGRADE_FRAMES + 10):
+        governor.record(0.02)
+    assert governor.level == 1
+    assert governor.restore_frames[0] == 2 * RESTORE_FRAMES
+
+
+@pytest.mark.parametrize("fps, stall", [(60, 0.1), (30, 0.2)])
+def test_isolated_stall_does_not_degrade(fps, stall):
+    changes = []
+    governor = FrameGovernor(None, fps, on_change=changes.append)
+    simulate(governor, lambda level, frame: stall if frame == 100 else 0.002, 400)
+    assert changes == []
+
+
+@pytest.mark.parametrize("fps", [30, 60])
+def test_periodic_blocking_stalls_do_not_drive_quality_down(fps):
+    # A 200 ms blocking call on the Tk thread about every 0.6 s; lowering
+    # quality cannot remove that load, so it must not be chased
+    every = round(0.6 * fps)
+    changes = []
+    governor = FrameGovernor(None, fps, on_change=changes.append)
+    simulate(governor, lambda level, frame: 0.2 if frame % every == 0 else 0.002, 3000)
+    assert governor.level == 0
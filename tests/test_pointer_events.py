@@ -0,0 +1,72 @@
+"""Tests for the X RECORD pointer motion listener, using XTest input."""
+
+import threading
+import time
+
+import pytest
+
+xlib_display = pytest.importorskip("Xlib.display")
+from Xlib import X
+from Xlib.ext import xtest
+
+from pointer_events import PointerMotionListener
+
+
+def test_listener_receives_xtest_motion(x_display):
+    samples = []
+    received = threading.Event()
+
+    def on_motion(sample):
+        samples.append(sample)
+        if len(samples) >= 20:
+            received.set()
+
+    listener = PointerMotionListener(on_motion)
+    if not listener.start():
+        pytest.skip("display has no RECORD extension")
+    try:
+        injector = xlib_display.Display()
+        if not injector.has_extension("XTEST"):
+            pytest.skip("display has no XTEST extension")
+        # Give the RECORD context a moment to become active
+        time.sleep(0.2)
+        for i in range(20):
+            xtest.fake_input(injector, X.MotionNotify, x=100 + i * 5, y=200)
+            injector.flush()
+            time.sleep(0.005)
+        assert received.wait(timeout=5)
+        injector.close()
+    finally:
+        listener.stop()
+
+    assert [(s.x, s.y) for s in samples[:20]] == [(100 + i * 5, 200) for i in range(20)]
+    times = [s.server_time for s in samples]
+    assert times == sorted(times)
+    assert times[-1] > times[0]
+    assert not listener.running
+
+
+def test_callback_errors_do_not_stop_delivery(x_display):
+    calls = []
+    received = threading.Event()
+
+    def on_motion(sample):
+        calls.append(sample)
+        if len(calls) >= 2:
+            received.set()
+        raise RuntimeError("boom")
+
+    listener = PointerMotionListener(on_motion)
+    if not listener.start():
+        pytest.skip("display has no RECORD extension")
+    try:
+        injector = xlib_display.Display()
+        time.sleep(0.2)
+        for i in range(2):
+            xtest.fake_input(injector, X.MotionNotify, x=300 + i * 10, y=300)
+            injector.flush()
+        assert received.wait(timeout=5)
+        assert listener.running
+        injector.close()
+    finally:
+        listener.stop()
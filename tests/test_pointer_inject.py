@@ -0,0 +1,129 @@
+"""Tests for PointerInjector: frame scheduling on a fake clock, and XTest."""
+
+import threading
+import time
+
+import pytest
+
+from pointer_events import PointerMotionListener
+from pointer_inject import PointerInjector
+
+
+class FakeClock:
+    """A monotonic clock that only advances when slept on."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def scheduled_injector(frame_rate):
+    """Returns an injector on a fake clock whose `send` records (time, points)."""
+    clock = FakeClock()
+    injector = PointerInjector(frame_rate=frame_rate, clock=clock, sleep=clock.sleep)
+    sends = []
+    injector.send = lambda points, relative=False: sends.append((clock(), list(points)))
+    return injector, clock, sends
+
+
+def test_play_sends_first_point_immediately_and_returns_after_last():
+    injector, clock, sends = scheduled_injector(120)
+
+    assert injector.play([(5, 0), (-5, 0)], duration=0.02, relative=True)
+
+    assert sends == [(0.0, [(5, 0)]), (pytest.approx(0.02 / 3), [(-5, 0)])]
+    # Returns right after the final send instead of idling to the full duration
+    assert clock() == pytest.approx(0.02 / 3)
+
+
+def test_play_spreads_many_points_over_all_frames():
+    injector, clock, sends = scheduled_injector(100)
+    points = [(i, i) for i in range(25)]
+
+    assert injector.play(points, duration=0.05)
+
+    assert [p for _, batch in sends for p in batch] == points
+    assert [len(batch) for _, batch in sends] == [5, 5, 5, 5, 5]
+    assert [t for t, _ in sends] == pytest.approx([0.0, 0.01, 0.02, 0.03, 0.04])
+
+
+def test_play_keeps_deadlines_after_a_slow_frame():
+    injector, clock, sends = scheduled_injector(100)
+
+    def slow_send(points, relative=False):
+        sends.append((clock(), list(points)))
+        if len(sends) == 1:
+            clock.now += 0.025  # The first frame overruns two deadlines
+
+    injector.send = slow_send
+    assert injector.play([(i, 0) for i in range(4)], duration=0.04)
+
+    # Later frames are not pushed back by the overrun
+    assert [t for t, _ in sends] == pytest.approx([0.0, 0.025, 0.03])
+    assert [len(batch) for _, batch in sends] == [1, 2, 1]
+
+
+def test_play_stops_when_cancelled():
+    injector, clock, sends = scheduled_injector(100)
+
+    assert not injector.play([(i, 0) for i in range(10)], duration=0.1,
+                             cancelled=lambda: len(sends) >= 2)
+    assert len(sends) == 2
+
+
+@pytest.fixture
+def injector(x_display):
+    pytest.importorskip("Xlib")
+    injector = PointerInjector()
+    if not injector.start():
+        pytest.skip("display has no XTEST extension")
+    yield injector
+    injector.stop()
+
+
+def test_send_absolute_moves_the_pointer(injector):
+    injector.send([(100, 200)])
+    assert injector.position() == (100, 200)
+
+    # A whole batch goes out with one flush; the last point wins
+    injector.send([(10, 10), (20, 30), (300, 400)])
+    assert injector.position() == (300, 400)
+
+
+def test_send_relative_moves_from_the_current_position(injector):
+    injector.send([(100, 200)])
+    injector.send([(10, -5), (3, 3)], relative=True)
+    assert injector.position() == (113, 198)
+
+
+def test_glide_ends_at_the_target(injector):
+    injector.send([(0, 0)])
+    assert injector.glide(40, 25, duration=0.02)
+    assert injector.position() == (40, 25)
+
+
+def test_every_point_of_a_batch_reaches_the_server(injector):
+    samples = []
+    done = threading.Event()
+
+    def on_motion(sample):
+        samples.append((sample.x, sample.y))
+        if len(samples) >= 50:
+            done.set()
+
+    listener = PointerMotionListener(on_motion)
+    if not listener.start():
+        pytest.skip("display has no RECORD extension")
+    try:
+        time.sleep(0.2)
+        points = [(10 + i, 20 + i) for i in range(50)]
+        injector.send(points)
+        assert done.wait(timeout=5)
+    finally:
+        listener.stop()
+    assert samples[:50] == points
@@ -0,0 +1,68 @@
+"""Tests for the shared sprite cache."""
+
+import pytest
+
+from sprites import SHAPES, SpriteCache, _covers
+
+
+def mask(shape, size):
+    """Returns the shape as rows of '#' (covered) and '.' pixels."""
+    return [
+        "".join("#" if _covers(shape, size, x + 0.5, y + 0.5) else "." for x in range(size))
+        for y in range(size)
+    ]
+
+
+def test_square_covers_every_pixel():
+    assert mask("square", 10) == ["#" * 10] * 10
+
+
+def test_cross_is_two_pixels_wide_through_the_centre():
+    rows = mask("cross", 10)
+    assert rows[4] == rows[5] == "#" * 10
+    for y in (0, 1, 2, 3, 6, 7, 8, 9):
+        assert rows[y] == "....##...."
+
+
+def test_dot_is_a_symmetric_disc():
+    rows = mask("dot", 10)
+    assert rows[0] == "...####..."
+    assert rows[4] == "#" * 10
+    assert rows == rows[::-1]
+    assert all(row == row[::-1] for row in rows)
+
+
+def test_unknown_shape_draws_a_dot():
+    assert mask("star", 8) == mask("dot", 8)
+
+
+@pytest.fixture
+def root(x_display):
+    tk = pytest.importorskip("tkinter")
+    root = tk.Tk()
+    yield root
+    root.destroy()
+
+
+def test_get_returns_the_same_image_for_the_same_key(root):
+    sprites = SpriteCache(root)
+    first = sprites.get("cross", 10, "white")
+    assert sprites.get("cross", 10, "white") is first
+    assert sprites.get("cross", 10, "#ff0000") is not first
+    assert sprites.get("cross", 12, "white") is not first
+    assert len(sprites) == 3
+
+
+def test_rendered_pixels_match_the_shape(root):
+    sprites = SpriteCache(root)
+    image = sprites.get("cross", 10, "white")
+    assert (image.width(), image.height()) == (10, 10)
+    assert tuple(image.get(4, 0)) == (255, 255, 255)
+    assert tuple(image.get(0, 0)) == (0, 0, 0)
+
+
+def test_preload_renders_each_shape_once(root):
+    sprites = SpriteCache(root)
+    sprites.preload(SHAPES, 10)
+    sprites.preload(SHAPES, 10)
+    assert len(sprites) == len(SHAPES)